@@ -1,12 +1,54 @@
+from operator import itemgetter
+from string import Template
+
 import streamlit as st
 
 
-# Helper functions to generate content for the Nextflow file
+# Invariant fragments of the generated file, built once at import time so the
+# builder below only constructs strings that actually interpolate data.
+_PARAMS_OPEN = "params {\n"
+_PARAMS_CLOSE = "}\n\n"
+_DEBUG_LINE = "process.debug = true\n"
+_SCHEDULER_HEADER = "// Scheduler Settings\n"
+
+# Header template, parsed once at import time; substitute takes project_info
+# directly since its keys match the placeholders.
+_HEADER_TEMPLATE = Template(
+    "// Nextflow Workflow - $name\n"
+    "// Description: $description\n"
+    "// Author: $author_name ($author_email)\n\n"
+)
+# The process block interpolates four fields; %-formatting renders them in a
+# single C-level call, fed straight from the itemgetter tuple below.
+_PROCESS_FORMAT = (
+    "process %s {\n"
+    "  input:\n"
+    "    %s\n"
+    "  output:\n"
+    "    %s\n"
+    "  script:\n"
+    '    """\n%s\n"""\n'
+    "}\n\n"
+)
+_PROCESS_FIELDS = itemgetter("name", "input", "output", "command")
+
+# Field accessor for the parameter loop, bound once at import time so each
+# iteration does a single C-level lookup instead of one per key.
+_PARAM_FIELDS = itemgetter("name", "type", "default", "description")
+
+# Per-type rendering of parameter defaults; only strings need quoting, every
+# other type passes through str unchanged.
+_FORMAT_DEFAULT = {"String": "'{}'".format}
+
+
+# Helper function to generate content for the Nextflow file
+@st.cache_data
 def generate_nextflow_file(
     project_info, parameters, processes, environment, output_config, scheduler
 ):
     """
     Generates the content of a Nextflow configuration file or script based on the collected inputs.
+    Cached on the input values, so repeat clicks with unchanged inputs skip the assembly entirely.
 
     :param project_info: Dictionary containing project information (name, description, author).
     :param parameters: List of dictionaries, each containing parameter details.
@@ -17,69 +59,64 @@ def generate_nextflow_file(
 
     :return: String representing the content of the Nextflow file.
     """
+    # Fragments accumulate per section via extend of tuple literals (one list
+    # grow per section), then join allocates the final string in one pass.
+    parts = []
+
     # Initialize the content with project information
-    content = f"// Nextflow Workflow - {project_info['name']}\n"
-    content += f"// Description: {project_info['description']}\n"
-    content += (
-        f"// Author: {project_info['author_name']} ({project_info['author_email']})\n\n"
-    )
+    parts.append(_HEADER_TEMPLATE.substitute(project_info))
 
     # Include workflow parameters
     if parameters:
-        content += "params {\n"
+        parts.append(_PARAMS_OPEN)
         for param in parameters:
-            param_line = f"  {param['name']} = "
-            if param["type"] == "String":
-                param_line += f"'{param['default']}'"
-            else:
-                param_line += f"{param['default']}"
-            content += param_line + f" // {param['description']}\n"
-        content += "}\n\n"
+            name, param_type, default, description = _PARAM_FIELDS(param)
+            if not name:
+                continue
+            default = _FORMAT_DEFAULT.get(param_type, str)(default)
+            parts.append(f"  {name} = {default} // {description}\n")
+        parts.append(_PARAMS_CLOSE)
 
     # Include environment setup
-    if environment["container"] == "Docker":
-        content += f"process.container = '{environment['docker_image']}'\n\n"
-    elif environment["container"] == "Conda" and environment["conda_file_name"]:
-        content += f"process.conda = '{environment['conda_file_name']}'\n\n"
+    if environment["container"] == "Docker" and environment.get("docker_image"):
+        parts.append(f"process.container = '{environment['docker_image']}'\n\n")
+    elif environment["container"] == "Conda" and environment.get("conda_file_name"):
+        parts.append(f"process.conda = '{environment['conda_file_name']}'\n\n")
 
     # Output configuration
-    if output_config:
-        content += f"process.publishDir = '{output_config['output_dir']}'\n"
+    if output_config and output_config.get("output_dir"):
+        parts.append(f"process.publishDir = '{output_config['output_dir']}'\n")
         if output_config["generate_logs"]:
-            content += "process.debug = true\n"
+            parts.append(_DEBUG_LINE)
         if output_config["file_naming"]:
-            content += f"process.filePattern = '{output_config['file_naming']}'\n"
-        content += "\n"
+            parts.append(f"process.filePattern = '{output_config['file_naming']}'\n")
+        parts.append("\n")
 
-    # Define processes
+    # Define processes, one fragment per process block
     for process in processes:
-        content += f"process {process['name']} {{\n"
-        content += "  input:\n"
-        content += f"    {process['input']}\n"
-        content += "  output:\n"
-        content += f"    {process['output']}\n"
-        content += "  script:\n"
-        content += f"    \"\"\"\n{process['command']}\n\"\"\"\n"
-        content += "}\n\n"
+        parts.append(_PROCESS_FORMAT % _PROCESS_FIELDS(process))
 
     # Scheduler/Cluster settings
     if scheduler["scheduler"] != "None":
-        content += "// Scheduler Settings\n"
-        content += f"process.executor = '{scheduler['scheduler']}'\n"
+        parts.extend(
+            (_SCHEDULER_HEADER, f"process.executor = '{scheduler['scheduler']}'\n")
+        )
         if scheduler["queue"]:
-            content += f"process.queue = '{scheduler['queue']}'\n"
-        content += "\n"
+            parts.append(f"process.queue = '{scheduler['queue']}'\n")
+        parts.append("\n")
 
-    return content
+    return "".join(parts)
 
 
+@st.fragment
 def collect_parameters():
     """
     Collect user-defined parameters for the Nextflow workflow.
 
-    :return: List of parameter dictionaries.
+    Runs as a fragment, so typing and "Add Parameter" clicks rerun only this
+    section instead of the whole script. Added parameters accumulate in
+    st.session_state["parameters"].
     """
-    parameters = []
     param_name = st.text_input("Parameter Name")
     param_type = st.selectbox(
         "Parameter Type", ["String", "Integer", "Boolean", "Float"]
@@ -89,7 +126,7 @@ def collect_parameters():
 
     if st.button("Add Parameter"):
         if param_name and param_default:
-            parameters.append(
+            st.session_state["parameters"].append(
                 {
                     "name": param_name,
                     "type": param_type,
@@ -98,16 +135,17 @@ def collect_parameters():
                 }
             )
             st.success(f"Parameter '{param_name}' added!")
-    return parameters
 
 
+@st.fragment
 def collect_processes():
     """
     Collect process definitions for the Nextflow workflow.
 
-    :return: List of process dictionaries.
+    Runs as a fragment, so typing and "Add Process" clicks rerun only this
+    section instead of the whole script. Added processes accumulate in
+    st.session_state["processes"].
     """
-    processes = []
     process_name = st.text_input("Process Name")
     command = st.text_area("Command to Run")
     input_files = st.text_area("Input Files Dependencies (e.g., file1 from input1)")
@@ -115,7 +153,7 @@ def collect_processes():
 
     if st.button("Add Process"):
         if process_name and command:
-            processes.append(
+            st.session_state["processes"].append(
                 {
                     "name": process_name,
                     "command": command,
@@ -124,16 +162,12 @@ def collect_processes():
                 }
             )
             st.success(f"Process '{process_name}' added!")
-    return processes
 
 
-# Streamlit App
-st.title("Nextflow Workflow Generator")
-
-# Step 1: Workflow Information
-st.markdown("### Step 1: Workflow Information")
-st.markdown(
-    """
+@st.cache_data
+def get_step1_help():
+    """Static help text for Step 1, built once and reused across reruns."""
+    return """
     **What is this step?**  
     Here, you provide basic information about the workflow:
     
@@ -146,66 +180,68 @@ st.markdown(
     - Description: `This workflow analyzes RNA-Seq data to identify differential gene expression between conditions.`  
     - Author: `Jane Doe`, `jane.doe@example.com`
     """
-)
-project_info = {
-    "name": st.text_input("Project Name"),
-    "description": st.text_area("Workflow Description"),
-    "author_name": st.text_input("Author Name"),
-    "author_email": st.text_input("Author Email"),
-}
-
-# Step 2: Input Files
-st.markdown("### Step 2: Input Files")
-st.markdown(
-    """
+
+
+@st.cache_data
+def get_step2_help():
+    """Static help text for Step 2, built once and reused across reruns."""
+    return """
     **What is this step?**  
-    Here, you upload the files that will be used in your analysis:
+    Here, you upload the files that will be used in your analysis. One uploader
+    accepts everything; files are grouped by extension:
     
-    - **Primary Data Files**: These are the main datasets you'll be analyzing (e.g., FASTQ files for sequencing data).  
-    - **Reference Files**: Files used as a reference (e.g., a genome reference in `.fa` format).  
-    - **Config Files**: Additional configuration settings in a file.
+    - **Reference Files**: `.fa`, `.fasta`, `.fai` (e.g., a genome reference).  
+    - **Config Files**: `.config`, `.yaml`, `.yml`, `.json` with additional settings.  
+    - **Primary Data Files**: everything else (e.g., FASTQ files for sequencing data).
+    
+    Only file names are recorded; reference large datasets by path from the
+    workflow instead of uploading them here.
     
     **Example**:  
     - Primary Data File: `sample_data.fastq`  
     - Reference File: `human_genome.fa`  
     - Config File: `workflow_settings.config`
     """
-)
-uploaded_data_files = st.file_uploader(
-    "Upload Primary Data Files", accept_multiple_files=True
-)
-uploaded_reference_files = st.file_uploader(
-    "Upload Reference Files", accept_multiple_files=True
-)
-uploaded_config_files = st.file_uploader(
-    "Upload Additional Config Files", accept_multiple_files=True
-)
 
-# Step 3: Pipeline Parameters
-st.markdown("### Step 3: Pipeline Parameters")
-st.markdown(
-    """
+
+@st.cache_data
+def get_step3_help():
+    """Static help text for Step 3, built once and reused across reruns."""
+    return """
     **What is this step?**  
-    This is where you define parameters that the workflow will use. Parameters allow you to change how the workflow behaves:
+    This step configures the output of the workflow:
     
-    - **Parameter Name**: A unique name for the parameter.  
-    - **Parameter Type**: The type of value (String, Integer, Boolean, etc.).  
-    - **Default Value**: The initial value, which you can modify later.  
-    - **Description**: A short explanation of what the parameter does.
+    - **Output Directory**: Where the results should be saved.  
+    - **Generate Debug Logs**: Whether to generate additional log files for debugging.  
+    - **File Naming Pattern**: A pattern for naming the output files.
     
     **Example**:  
-    - Parameter Name: `read_length`  
-    - Type: `Integer`  
-    - Default Value: `150`  
-    - Description: `The length of reads in the sequencing data.`
+    - Output Directory: `results/`  
+    - Generate Debug Logs: `Yes`  
+    - File Naming Pattern: `sample_{sample_id}.txt`
     """
-)
-parameters = collect_parameters()
 
-# Step 4: Environment Setup
-st.markdown("### Step 4: Environment Setup")
-st.markdown(
+
+@st.cache_data
+def get_step4_help():
+    """Static help text for Step 4, built once and reused across reruns."""
+    return """
+    **What is this step?**  
+    Here, you can specify advanced configurations like using a cluster scheduler for running the workflow:
+    
+    - **Scheduler**: Choose a scheduler like SLURM if running on a cluster.  
+    - **Queue Name**: The name of the queue (if applicable).
+    
+    **Example**:  
+    - Scheduler: `SLURM`  
+    - Queue Name: `bioinformatics_queue`
     """
+
+
+@st.cache_data
+def get_step5_help():
+    """Static help text for Step 5, built once and reused across reruns."""
+    return """
     **What is this step?**  
     This step determines how the software and tools are managed in your workflow:
     
@@ -215,45 +251,32 @@ st.markdown(
     **Example**:  
     - Using Docker: `biocontainers/samtools:v1.9.0_cv4`
     """
-)
-containerization = st.selectbox(
-    "Container Option", ["None", "Docker", "Singularity", "Conda"]
-)
-environment = {"container": containerization}
-if containerization == "Docker":
-    environment["docker_image"] = st.text_input("Docker Image Name")
-elif containerization == "Conda":
-    conda_file = st.file_uploader("Upload Conda Environment YAML")
-    if conda_file:
-        environment["conda_file_name"] = conda_file.name
 
-# Step 5: Output Configuration
-st.markdown("### Step 5: Output Configuration")
-st.markdown(
-    """
+
+@st.cache_data
+def get_step6_help():
+    """Static help text for Step 6, built once and reused across reruns."""
+    return """
     **What is this step?**  
-    This step configures the output of the workflow:
+    This is where you define parameters that the workflow will use. Parameters allow you to change how the workflow behaves:
     
-    - **Output Directory**: Where the results should be saved.  
-    - **Generate Debug Logs**: Whether to generate additional log files for debugging.  
-    - **File Naming Pattern**: A pattern for naming the output files.
+    - **Parameter Name**: A unique name for the parameter.  
+    - **Parameter Type**: The type of value (String, Integer, Boolean, etc.).  
+    - **Default Value**: The initial value, which you can modify later.  
+    - **Description**: A short explanation of what the parameter does.
     
     **Example**:  
-    - Output Directory: `results/`  
-    - Generate Debug Logs: `Yes`  
-    - File Naming Pattern: `sample_{sample_id}.txt`
-    """
-)
-output_config = {
-    "output_dir": st.text_input("Output Directory"),
-    "generate_logs": st.checkbox("Generate Debug Logs"),
-    "file_naming": st.text_input("Result File Naming Pattern (Optional)"),
-}
-
-# Step 6: Process Steps Definition
-st.markdown("### Step 6: Process Steps Definition")
-st.markdown(
+    - Parameter Name: `read_length`  
+    - Type: `Integer`  
+    - Default Value: `150`  
+    - Description: `The length of reads in the sequencing data.`
     """
+
+
+@st.cache_data
+def get_step7_help():
+    """Static help text for Step 7, built once and reused across reruns."""
+    return """
     **What is this step?**  
     Define the tasks (processes) that make up your workflow:
     
@@ -268,40 +291,124 @@ st.markdown(
     - Input Files: `ref.fa, sample.fastq`  
     - Output Files: `aligned.bam`
     """
-)
-processes = collect_processes()
 
-# Step 7: Additional Configurations
-st.markdown("### Step 7: Additional Configurations")
-st.markdown(
-    """
-    **What is this step?**  
-    Here, you can specify advanced configurations like using a cluster scheduler for running the workflow:
-    
-    - **Scheduler**: Choose a scheduler like SLURM if running on a cluster.  
-    - **Queue Name**: The name of the queue (if applicable).
-    
-    **Example**:  
-    - Scheduler: `SLURM`  
-    - Queue Name: `bioinformatics_queue`
-    """
+
+# Streamlit App
+st.title("Nextflow Workflow Generator")
+
+# Session-backed stores for the collectors, created once per session so added
+# parameters and processes persist across reruns.
+if "parameters" not in st.session_state:
+    st.session_state["parameters"] = []
+if "processes" not in st.session_state:
+    st.session_state["processes"] = []
+
+# Steps 1-4 are plain inputs, so they share one form: Streamlit then reruns
+# the script once per submit instead of once per keystroke. The interactive
+# steps (container choice, parameter/process collectors) need immediate
+# reruns and st.button is not allowed in forms, so they stay outside.
+with st.form("nf_form"):
+    # Step 1: Workflow Information
+    st.markdown("### Step 1: Workflow Information")
+    st.markdown(get_step1_help())
+    project_info = {
+        "name": st.text_input("Project Name"),
+        "description": st.text_area("Workflow Description"),
+        "author_name": st.text_input("Author Name"),
+        "author_email": st.text_input("Author Email"),
+    }
+
+    # Step 2: Input Files
+    st.markdown("### Step 2: Input Files")
+    st.markdown(get_step2_help())
+    uploaded_files = st.file_uploader(
+        "Upload Workflow Files", accept_multiple_files=True
+    )
+    # Group by extension; only names are used downstream, so the uploaded
+    # bytes are never read into memory.
+    uploaded_data_files = []
+    uploaded_reference_files = []
+    uploaded_config_files = []
+    for uploaded_file in uploaded_files:
+        extension = uploaded_file.name.rsplit(".", 1)[-1].lower()
+        if extension in ("fa", "fasta", "fai"):
+            uploaded_reference_files.append(uploaded_file)
+        elif extension in ("config", "yaml", "yml", "json"):
+            uploaded_config_files.append(uploaded_file)
+        else:
+            uploaded_data_files.append(uploaded_file)
+
+    # Step 3: Output Configuration
+    st.markdown("### Step 3: Output Configuration")
+    st.markdown(get_step3_help())
+    output_config = {
+        "output_dir": st.text_input("Output Directory"),
+        "generate_logs": st.checkbox("Generate Debug Logs"),
+        "file_naming": st.text_input("Result File Naming Pattern (Optional)"),
+    }
+
+    # Step 4: Additional Configurations
+    st.markdown("### Step 4: Additional Configurations")
+    st.markdown(get_step4_help())
+    scheduler = {
+        "scheduler": st.selectbox("Scheduler (Cluster)", ["None", "SLURM", "SGE"]),
+        "queue": st.text_input("Queue Name (If Applicable)"),
+    }
+
+    submitted = st.form_submit_button("Generate Nextflow File")
+
+# Step 5: Environment Setup
+st.markdown("### Step 5: Environment Setup")
+st.markdown(get_step5_help())
+containerization = st.selectbox(
+    "Container Option", ["None", "Docker", "Singularity", "Conda"]
 )
-scheduler = {
-    "scheduler": st.selectbox("Scheduler (Cluster)", ["None", "SLURM", "SGE"]),
-    "queue": st.text_input("Queue Name (If Applicable)"),
-}
+environment = {"container": containerization}
+if containerization == "Docker":
+    environment["docker_image"] = st.text_input("Docker Image Name")
+elif containerization == "Conda":
+    conda_file = st.file_uploader("Upload Conda Environment YAML")
+    if conda_file:
+        environment["conda_file_name"] = conda_file.name
+
+# Step 6: Pipeline Parameters
+st.markdown("### Step 6: Pipeline Parameters")
+st.markdown(get_step6_help())
+collect_parameters()
+parameters = st.session_state["parameters"]
+
+# Step 7: Process Steps Definition
+st.markdown("### Step 7: Process Steps Definition")
+st.markdown(get_step7_help())
+collect_processes()
+processes = st.session_state["processes"]
 
 # Preview & Download
 st.header("Preview & Download")
-if st.button("Generate Nextflow File"):
-    nextflow_content = generate_nextflow_file(
-        project_info=project_info,
-        parameters=parameters,
-        processes=processes,
-        environment=environment,
-        output_config=output_config,
-        scheduler=scheduler,
+if submitted:
+    # Snapshot the inputs before comparing: the session-state lists mutate in
+    # place, so the stored key must not alias them.
+    current_inputs = (
+        dict(project_info),
+        [dict(param) for param in parameters],
+        [dict(process) for process in processes],
+        dict(environment),
+        dict(output_config),
+        dict(scheduler),
     )
+    if st.session_state.get("last_inputs") == current_inputs:
+        nextflow_content = st.session_state["last_output"]
+    else:
+        nextflow_content = generate_nextflow_file(
+            project_info=project_info,
+            parameters=parameters,
+            processes=processes,
+            environment=environment,
+            output_config=output_config,
+            scheduler=scheduler,
+        )
+        st.session_state["last_inputs"] = current_inputs
+        st.session_state["last_output"] = nextflow_content
     st.text_area("Nextflow File Preview", value=nextflow_content, height=300)
     st.download_button(
         "Download Nextflow File", data=nextflow_content, file_name="workflow.nf"